@@ -1,9 +1,13 @@
+import concurrent.futures
+import contextlib
 import datetime
+import itertools
 import logging
 import os
 import pathlib
 import time
 import multiprocessing
+import multiprocessing.pool
 
 from typing import (
         IO,
@@ -11,8 +15,12 @@ from typing import (
         List,
         Callable,
         Dict,
+        Hashable,
+        Iterable,
+        Iterator,
         Optional,
         Text,
+        Tuple,
         Union,
     )
 
@@ -32,7 +40,7 @@ from .nodes import (
 
 from .cache import Cache, FilesystemCache, NullCache, Sqlite3Cache, RedisCache
 from .util import FilesystemWalker, flatten_dictionary
-from .yaml import load_yaml
+from .yaml import load_yaml, load_yaml_file, _add_cache_entry
 
 __version__ = '2.5.4'
 __all__ = [
@@ -62,24 +70,139 @@ __path__ = extend_path(__path__, __name__)
 __ROOT_PATH = pathlib.PurePosixPath('/')
 
 
-def _create_relative_path(path: pathlib.Path, root: pathlib.Path) \
-        -> pathlib.PurePosixPath:
+def _split_suffix(name: str) -> Tuple[str, str]:
+    """Split a file name into the stem and the suffix.
+
+    This follows the same rules as ``pathlib.PurePath.stem`` and
+    ``pathlib.PurePath.suffix`` without having to create a path object."""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ''
+
+
+def _get_relative_dirpath(dirpath: str, root: pathlib.Path) -> str:
+    """Get the part of ``dirpath`` below ``root``, separated by ``/``.
+
+    ``dirpath`` must be either ``root`` or a directory below it as produced by
+    walking ``root``. For ``root`` itself, this returns an empty string."""
+    relative = dirpath[len(str(root)) + 1:]
+    if os.sep != '/':
+        relative = relative.replace(os.sep, '/')
+    return relative
+
+
+def _create_relative_path(relative_path: str) -> pathlib.PurePosixPath:
     """"Make a root-relative path.
 
-    This turns `directory/foo/bar` into `/foo/bar`. Both `root` and `path`
-    can be relative or absolute paths."""
-    # Extra check, as with_name would fail on an empty path
-    if path == root:
+    This turns `foo/bar.md` into `/foo/bar`. `relative_path` must be
+    separated by ``/``, and an empty path produces ``/``. This works on plain
+    strings, as creating and transforming ``pathlib`` paths for every file
+    shows up in profiles otherwise."""
+    if not relative_path:
         return __ROOT_PATH
 
-    path = path.relative_to(root)
-    return __ROOT_PATH / pathlib.PurePosixPath(path.with_name(path.stem))
+    directory, _, name = relative_path.rpartition('/')
+    stem, _ = _split_suffix(name)
+    if directory:
+        return pathlib.PurePosixPath(f'/{directory}/{stem}')
+    return pathlib.PurePosixPath('/' + stem)
+
+
+def _join_relative_path(relative_dirpath: str, filename: str) -> str:
+    if relative_dirpath:
+        return relative_dirpath + '/' + filename
+    return filename
 
 
 def _process_resource_task(t):
     return t.process()
 
 
+def _split_content_files(filenames: Iterable[str]) \
+        -> Tuple[List[Tuple[str, str, str]], List[Tuple[str, str, str]]]:
+    """Split the files of a content directory into ``_index`` candidates and
+    everything else, resolving the suffix along the way. Metadata files are
+    dropped, as they're handled while dealing with the actual content.
+
+    :return: Two lists of ``(filename, stem, suffix)`` tuples.
+    """
+    index_files = []
+    files = []
+    for filename in filenames:
+        if filename.startswith('_index'):
+            index_files.append((filename, *_split_suffix(filename),))
+        elif not filename.endswith('.meta'):
+            files.append((filename, *_split_suffix(filename),))
+    return index_files, files
+
+
+def _find_yaml_sources(dirpath: str, filenames: List[str],
+                       document_types: Iterable[str]) \
+        -> List[Tuple[str, bool]]:
+    """Find all files in a directory which will get parsed as Yaml during
+    content discovery.
+
+    :return: A list of ``(path, is_document)`` tuples. ``is_document`` is
+             ``True`` for documents with front matter, and ``False`` for
+             plain Yaml files.
+    """
+    names = set(filenames)
+    index_files, files = _split_content_files(filenames)
+
+    # Only the first supported _index file gets used as the index
+    index_files = [entry for entry in index_files
+                   if entry[2] in document_types][:1]
+
+    sources = []
+    for filename, stem, suffix in itertools.chain(index_files, files):
+        metadata_path = os.path.join(dirpath, stem + '.meta')
+        if suffix in document_types:
+            if stem + '.meta' in names:
+                sources.append((metadata_path, False,))
+            else:
+                sources.append((os.path.join(dirpath, filename), True,))
+        elif suffix == '.yaml':
+            sources.append((os.path.join(dirpath, filename), False,))
+        elif stem + '.meta' in names:
+            # Static files can have metadata as well
+            sources.append((metadata_path, False,))
+    return sources
+
+
+def _parse_yaml_task(sources: List[Tuple[str, bool]]) \
+        -> List[Tuple[Hashable, bytes]]:
+    """Parse Yaml files and document front matter on a worker process.
+
+    :return: The cache entries for the main process' Yaml cache.
+    """
+    from .nodes import MetadataKind, _split_metadata_content
+    from .yaml import _create_cache_entry, _file_cache_key, load_yaml
+
+    entries = []
+    for path, is_document in sources:
+        try:
+            if is_document:
+                with open(path, encoding='utf-8') as f:
+                    metadata_kind, key, _, _ = \
+                        _split_metadata_content(f.read())
+                if metadata_kind != MetadataKind.Yaml:
+                    continue
+                document = load_yaml(key)
+            else:
+                key = _file_cache_key(path)
+                with open(path, 'rb') as f:
+                    document = load_yaml(f)
+        except Exception:
+            # Errors get reported once the node gets created on the main
+            # process
+            continue
+
+        if (data := _create_cache_entry(document)) is not None:
+            entries.append((key, data,))
+    return entries
+
+
 def _setup_multiprocessing_worker(log_level):
     from .cmdline import _setup_logging
     if log_level == logging.DEBUG:
@@ -89,6 +212,15 @@ def _setup_multiprocessing_worker(log_level):
     else:
         _setup_logging(False, False)
 
+    # Import the modules used by the worker tasks up-front. This way, all
+    # workers pay the import cost in parallel while the pool starts up,
+    # instead of each worker paying it in turn once it gets its first task
+    from .yaml import _get_loader
+    _get_loader()
+
+    import PIL.Image  # noqa: F401
+    import sass  # noqa: F401
+
 
 class Liara:
     """Main entry point for Liara. This class handles all the state required
@@ -105,6 +237,8 @@ class Liara:
     __registered_plugins: Dict[object, object] = dict()
     __filesystem_walker: FilesystemWalker
     __template_repository: TemplateRepository
+    # Set while a build is running with parallel processing enabled
+    __pool: Optional[multiprocessing.pool.Pool] = None
 
     def __init__(self,
                  configuration: Optional[
@@ -121,7 +255,7 @@ class Liara:
         if configuration is None:
             project_configuration = {}
         elif isinstance(configuration, str):
-            project_configuration = load_yaml(open(configuration))
+            project_configuration = load_yaml_file(configuration)
         else:
             project_configuration = load_yaml(configuration)
 
@@ -255,7 +389,7 @@ class Liara:
 
         template_path = configuration_file.parent
         default_configuration = config.create_default_template_configuration()
-        configuration = load_yaml(open(configuration_file))
+        configuration = load_yaml_file(configuration_file)
 
         ignore_list = {
             # Legacy
@@ -323,7 +457,7 @@ class Liara:
 
         base_url = site.metadata['base_url']
 
-        routes = load_yaml(static_routes.open())
+        routes = load_yaml_file(static_routes)
         for route in routes:
             node = RedirectionNode(
                     pathlib.PurePosixPath(route['src']),
@@ -341,75 +475,96 @@ class Liara:
                 })
                 site.add_generated(node)
 
-    def __discover_content(self, site: Site, content_root: pathlib.Path) \
+    def __discover_content(self, site: Site, content_root: pathlib.Path,
+                           pool: Optional[multiprocessing.pool.Pool] = None) \
             -> None:
         from .nodes import DataNode, IndexNode, Node, StaticNode
 
         document_factory = self.__document_node_factory
 
-        for dirpath, filenames in self.__filesystem_walker.walk(content_root):
-            directory = pathlib.Path(dirpath)
-            # Need to run two passes here: First, we check if an _index file is
-            # present in this folder, in which case it's the root of this
-            # directory
-            # Otherwise, we create a new index node
+        directories = list(self.__filesystem_walker.walk(content_root))
+
+        # Parsing Yaml dominates the discovery time, so if we have a pool, we
+        # parse everything ahead on the workers and populate the Yaml cache
+        # as we go. Node creation has to happen here, as it triggers signals
+        # and fixups.
+        if pool:
+            yaml_cache_entries = pool.imap(
+                _parse_yaml_task,
+                [_find_yaml_sources(dirpath, filenames,
+                                    document_factory.known_types)
+                 for dirpath, filenames in directories])
+        else:
+            yaml_cache_entries = itertools.repeat([])
+
+        for (dirpath, filenames), entries in zip(directories,
+                                                 yaml_cache_entries):
+            for key, data in entries:
+                _add_cache_entry(key, data)
+
+            relative_dirpath = _get_relative_dirpath(dirpath, content_root)
+            # Metadata files are looked up here instead of checking the
+            # filesystem for every file
+            names = set(filenames)
+
+            def get_metadata_path(stem: str) -> Optional[pathlib.Path]:
+                if stem + '.meta' in names:
+                    return pathlib.Path(os.path.join(dirpath, stem + '.meta'))
+                return None
+
+            index_files, files = _split_content_files(filenames)
+
+            # The index must be created first: If an _index file is present in
+            # this folder, it's the root of this directory. Otherwise, we
+            # create a new index node
             node: Node
             indexNode: Optional[Node] = None
-            for filename in filenames:
-                if filename.startswith('_index'):
-                    src = pathlib.Path(os.path.join(dirpath, filename))
-                    if src.suffix not in document_factory.known_types:
-                        supported_file_types = ', '.join(
-                            document_factory.known_types
-                        )
-                        self.__log.warning(
-                            f'Ignoring "{src}", unsupported file '
-                            'type for index node. Supported file '
-                            f'types are: {supported_file_types}.')
-                        continue
+            for filename, stem, suffix in index_files:
+                src = pathlib.Path(os.path.join(dirpath, filename))
+                if suffix not in document_factory.known_types:
+                    supported_file_types = ', '.join(
+                        document_factory.known_types
+                    )
+                    self.__log.warning(
+                        f'Ignoring "{src}", unsupported file '
+                        'type for index node. Supported file '
+                        f'types are: {supported_file_types}.')
+                    continue
 
-                    relative_path = _create_relative_path(directory,
-                                                          content_root)
+                relative_path = _create_relative_path(relative_dirpath)
 
-                    metadata_path = src.with_suffix('.meta')
-                    if metadata_path.exists():
-                        node = document_factory.create_node(src.suffix, src,
-                                                            relative_path,
-                                                            metadata_path)
-                    else:
-                        node = document_factory.create_node(src.suffix, src,
-                                                            relative_path)
+                metadata_path = get_metadata_path(stem)
+                if metadata_path:
+                    node = document_factory.create_node(suffix, src,
+                                                        relative_path,
+                                                        metadata_path)
+                else:
+                    node = document_factory.create_node(suffix, src,
+                                                        relative_path)
 
-                    site.add_document(node)
-                    break
+                site.add_document(node)
+                break
             else:
-                node = IndexNode(_create_relative_path(directory,
-                                                       content_root))
+                node = IndexNode(_create_relative_path(relative_dirpath))
                 site.add_index(node)
                 indexNode = node
 
-            for filename in filenames:
-                if filename.startswith('_index'):
-                    continue
-
-                if filename.endswith('.meta'):
-                    # Metadata files are handled while dealing with the actual
-                    # content
-                    continue
-
-                src = pathlib.Path(os.path.join(directory, filename))
-                path = _create_relative_path(src, content_root)
+            for filename, stem, suffix in files:
+                src = pathlib.Path(os.path.join(dirpath, filename))
+                relative_path = _join_relative_path(relative_dirpath,
+                                                    filename)
 
-                if src.suffix in document_factory.known_types:
-                    metadata_path = src.with_suffix('.meta')
+                if suffix in document_factory.known_types:
+                    path = _create_relative_path(relative_path)
+                    metadata_path = get_metadata_path(stem)
                     try:
-                        if metadata_path.exists():
-                            node = document_factory.create_node(src.suffix,
+                        if metadata_path:
+                            node = document_factory.create_node(suffix,
                                                                 src,
                                                                 path,
                                                                 metadata_path)
                         else:
-                            node = document_factory.create_node(src.suffix,
+                            node = document_factory.create_node(suffix,
                                                                 src,
                                                                 path)
                     except Exception as e:
@@ -427,13 +582,15 @@ class Liara:
                     if indexNode:
                         assert isinstance(indexNode, IndexNode)
                         indexNode.add_reference(node)
-                elif src.suffix in {'.yaml'}:
-                    node = DataNode(src, path)
+                elif suffix == '.yaml':
+                    node = DataNode(src, _create_relative_path(relative_path))
                     site.add_data(node)
                 else:
-                    metadata_path = src.with_suffix('.meta')
-                    path = path.with_suffix(''.join(src.suffixes))
-                    if metadata_path.exists():
+                    # Static files keep their full name including all
+                    # suffixes
+                    path = pathlib.PurePosixPath('/' + relative_path)
+                    metadata_path = get_metadata_path(stem)
+                    if metadata_path:
                         node = StaticNode(src, path, metadata_path)
                     else:
                         node = StaticNode(src, path)
@@ -442,17 +599,14 @@ class Liara:
     def __discover_static(self, site: Site, static_root: pathlib.Path) -> None:
         from .nodes import StaticNode
         for dirpath, filenames in self.__filesystem_walker.walk(static_root):
-            directory = pathlib.Path(dirpath)
+            relative_dirpath = _get_relative_dirpath(dirpath, static_root)
 
             for filename in filenames:
-                src = directory / filename
+                src = pathlib.Path(os.path.join(dirpath, filename))
 
-                path = _create_relative_path(src, static_root)
-                # We need to re-append the source suffix
-                # We can't use .with_suffix, as this will break on paths like
-                # a.b.c, where with_suffix('foo') will produce a.b.foo instead
-                # of a.b.c.foo
-                path = path.parent / (path.name + src.suffix)
+                # Static files keep their full name including all suffixes
+                path = pathlib.PurePosixPath(
+                    '/' + _join_relative_path(relative_dirpath, filename))
 
                 # We don't support metadata on static content inside the
                 # static directory. Everything here gets passed through
@@ -465,19 +619,24 @@ class Liara:
                              resource_factory: ResourceNodeFactory,
                              resource_root: pathlib.Path) -> None:
         for dirpath, filenames in self.__filesystem_walker.walk(resource_root):
+            relative_dirpath = _get_relative_dirpath(dirpath, resource_root)
+            names = set(filenames)
+
             for filename in filenames:
                 if filename.endswith('.meta'):
                     continue
 
+                stem, suffix = _split_suffix(filename)
                 src = pathlib.Path(os.path.join(dirpath, filename))
-                path = _create_relative_path(src, resource_root)
+                path = _create_relative_path(
+                    _join_relative_path(relative_dirpath, filename))
 
-                if src.suffix not in resource_factory.known_types:
+                if suffix not in resource_factory.known_types:
                     supported_resource_types = ','.join(
                         resource_factory.known_types)
                     self.__log.warning(
                         f'Ignoring resource "{src}" as the file '
-                        f'type {src.suffix} is not a supported '
+                        f'type {suffix} is not a supported '
                         'resource file type. Supported resource types are: '
                         + supported_resource_types + '. '
                         'Please place static files that don\'t '
@@ -485,12 +644,13 @@ class Liara:
                         'static directory.')
                     continue
 
-                metadata_path = src.with_suffix('.meta')
-                if metadata_path.exists():
-                    node = resource_factory.create_node(src.suffix, src, path,
+                if stem + '.meta' in names:
+                    metadata_path = pathlib.Path(
+                        os.path.join(dirpath, stem + '.meta'))
+                    node = resource_factory.create_node(suffix, src, path,
                                                         metadata_path)
                 else:
-                    node = resource_factory.create_node(src.suffix, src, path)
+                    node = resource_factory.create_node(suffix, src, path)
                 site.add_resource(node)
 
     def __discover_feeds(self, site: Site, feeds: pathlib.Path) -> None:
@@ -499,7 +659,7 @@ class Liara:
         if not feeds.exists():
             return
 
-        for key, options in load_yaml(feeds.open()).items():
+        for key, options in load_yaml_file(feeds).items():
             path = pathlib.PurePosixPath(options['path'])
             del options['path']
 
@@ -519,14 +679,20 @@ class Liara:
         if not metadata.exists():
             return
 
-        site.set_metadata(load_yaml(metadata.open()))
+        site.set_metadata(load_yaml_file(metadata))
 
         if self.__base_url_override:
             site.set_metadata_item('base_url', self.__base_url_override)
 
-    def discover_content(self) -> Site:
+    def discover_content(self, *, parallel=False) -> Site:
         """Discover all content and build the :py:class:`liara.site.Site`
-        instance."""
+        instance.
+
+        :param bool parallel: If `True`, files will be parsed in parallel.
+
+        .. versionchanged:: 2.5.5
+           Added the ``parallel`` parameter.
+        """
         self.__log.info('Discovering content ...')
         configuration = self.__configuration
 
@@ -534,7 +700,11 @@ class Liara:
         self.__discover_metadata(self.__site, metadata)
 
         content_root = pathlib.Path(configuration['content_directory'])
-        self.__discover_content(self.__site, content_root)
+        if parallel:
+            with self.__worker_pool() as pool:
+                self.__discover_content(self.__site, content_root, pool)
+        else:
+            self.__discover_content(self.__site, content_root)
 
         static_root = pathlib.Path(configuration['static_directory'])
         self.__discover_static(self.__site, static_root)
@@ -559,13 +729,13 @@ class Liara:
             collections = pathlib.Path(configuration['collections'])
             if collections.exists():
                 self.__site.create_collections(
-                    load_yaml(collections.read_text()))
+                    load_yaml_file(collections))
 
         if 'indices' in configuration:
             indices = pathlib.Path(configuration['indices'])
             if indices.exists():
                 self.__site.create_indices(
-                    load_yaml(indices.read_text()))
+                    load_yaml_file(indices))
 
         self.__site.create_links()
 
@@ -602,9 +772,7 @@ class Liara:
             self.__log.debug('%d async resource tasks pending ...',
                              len(async_resource_tasks))
 
-            with multiprocessing.Pool(
-                    initializer=_setup_multiprocessing_worker,
-                    initargs=(logging.root.level,)) as pool:
+            with self.__worker_pool() as pool:
                 async_resource_results = pool.map(
                     _process_resource_task,
                     [r[1] for r in async_resource_tasks])
@@ -622,6 +790,25 @@ class Liara:
 
         self.__log.info(f'Processed {len(site.resources)} resources')
 
+    @contextlib.contextmanager
+    def __worker_pool(self) -> Iterator[multiprocessing.pool.Pool]:
+        """Provide a pool of worker processes.
+
+        If a pool has been created for the current build already, it is reused
+        instead of starting new worker processes for every step."""
+        if self.__pool:
+            yield self.__pool
+            return
+
+        with multiprocessing.Pool(
+                initializer=_setup_multiprocessing_worker,
+                initargs=(logging.root.level,)) as pool:
+            self.__pool = pool
+            try:
+                yield pool
+            finally:
+                self.__pool = None
+
     def build(self, discover_content=True, *, disable_cache=False,
               parallel_build=True):
         """Build the site.
@@ -629,6 +816,17 @@ class Liara:
         :param bool discover_content: If `True`, :py:meth:`discover_content`
                                       will be called first.
         """
+        # Templates can't change during a build, so there's no need to check
+        # them for modifications every time one is used
+        with self.__template_repository.disable_reloading():
+            if parallel_build:
+                with self.__worker_pool():
+                    self.__build(discover_content, disable_cache,
+                                 parallel_build)
+            else:
+                self.__build(discover_content, disable_cache, parallel_build)
+
+    def __build(self, discover_content, disable_cache, parallel_build):
         from .publish import TemplatePublisher
         self.__log.info('Build started')
         start_time = time.time()
@@ -636,7 +834,7 @@ class Liara:
             self.__clean_output()
 
         if discover_content:
-            site = self.discover_content()
+            site = self.discover_content(parallel=parallel_build)
         else:
             site = self.__site
 
@@ -663,6 +861,9 @@ class Liara:
 
         publisher = TemplatePublisher(output_path, site,
                                       self.__template_repository)
+        # Compile all templates in one go before publishing, instead of
+        # interleaving it with the page rendering
+        self.__template_repository.preload_templates()
 
         self.__log.info('Publishing ...')
         for document in site.documents:
@@ -678,8 +879,11 @@ class Liara:
             resource.publish(publisher)
         self.__log.info(f'Published {len(site.resources)} resource(s)')
 
-        for static in site.static:
-            static.publish(publisher)
+        # Linking or copying static files is dominated by system calls which
+        # release the GIL, so those get published using a thread pool
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            for _ in executor.map(lambda s: s.publish(publisher), site.static):
+                pass
         self.__log.info('Published %d static file(s)', len(site.static))
 
         if site.generated:
@@ -12,17 +12,23 @@ def _extract_links(document: DocumentNode):
 
     This assumes the document has been already processed into valid Html.
     """
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(document.content, 'lxml')
+    import lxml.etree
+    import lxml.html
 
-    for item in soup.find_all(['img', 'a']):
-        if item.name == 'img':
-            target = item.attrs.get('src', None)
-        elif item.name == 'a':
-            target = item.attrs.get('href', None)
+    # lxml refuses to parse empty documents, which includes documents
+    # consisting only of whitespace or comments
+    if not document.content:
+        return
 
+    try:
+        tree = lxml.html.fromstring(document.content)
+    except lxml.etree.ParserError:
+        return
+
+    # Extract the link targets directly instead of walking all elements
+    for target in tree.xpath('//a/@href | //img/@src'):
         if target and not target.startswith('#'):
-            yield target
+            yield str(target)
 
 
 class LinkType(Enum):
@@ -75,7 +81,13 @@ def validate_internal_links(links: Dict[str, List[pathlib.PurePosixPath]],
 
     error_count = 0
 
+    url_strings = site.url_strings
     for link_str, sources in links.items():
+        # Most links point to an existing node and match its URL exactly, so
+        # check those without creating a path first
+        if link_str in url_strings:
+            continue
+
         link = pathlib.PurePosixPath(link_str)
 
         # Special case handling for index.html:
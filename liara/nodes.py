@@ -1,7 +1,7 @@
 from enum import auto, Enum
 import logging
 import pathlib
-from .yaml import load_yaml
+from .yaml import load_yaml_file, load_yaml_string
 
 try:
     import tomllib as toml
@@ -193,7 +193,9 @@ class Node:
         pass
 
 
-_metadata_marker = re.compile(r'(---|\+\+\+)\n')
+# The marker may also be the last line of a document without a trailing
+# new-line
+_metadata_marker = re.compile(r'(---|\+\+\+)(?:\n|\Z)')
 
 
 class MetadataKind(Enum):
@@ -202,6 +204,41 @@ class MetadataKind(Enum):
     Toml = auto()
 
 
+def _split_metadata_content(text: str) \
+        -> Tuple[MetadataKind, str, str, int]:
+    """Split the provided text into the metadata block and the content without
+    parsing the metadata.
+
+    :return: The metadata kind, the metadata block, the content and the line
+             on which the content starts.
+    """
+    start = _metadata_marker.search(text)
+    if start is None:
+        # We didn't find any metadata here, so everything must be content
+        return MetadataKind.Unknown, '', text, 1
+
+    if start.group(1) == '---':
+        metadata_kind = MetadataKind.Yaml
+    else:
+        metadata_kind = MetadataKind.Toml
+
+    end = _metadata_marker.search(text, start.end())
+    if end is None:
+        # An unterminated metadata block swallows the whole document
+        return metadata_kind, '', '', 3
+
+    if end.group(1) != start.group(1):
+        raise Exception('Metadata markers mismatch -- started '
+                        f'with "{start.group(1)}", but ended with '
+                        f'"{end.group(1)}"')
+
+    metadata = text[start.end():end.start()]
+    # +2 for the start/end marker, which is excluded from the metadata
+    # +1 because we start counting at 1
+    return (metadata_kind, metadata, text[end.end():],
+            metadata.count('\n') + 3)
+
+
 def extract_metadata_content(text: str):
     """Extract metadata and content.
 
@@ -216,50 +253,15 @@ def extract_metadata_content(text: str):
 
     This function splits the provided text into metadata and actual content.
     """
-    meta_start, meta_end = 0, 0
-    content_start, content_end = 0, 0
-    metadata_kind = MetadataKind.Unknown
-
-    # If the document doesn't end with a trailing new-line, the metadata regex
-    # will get confused. We'll thus add a new-line to make sure this works
-    if text and text[-1] != '\n':
-        text += '\n'
-
-    for match in _metadata_marker.finditer(text):
-        if meta_start == 0:
-            if match.group() == '---\n':
-                metadata_kind = MetadataKind.Yaml
-            elif match.group() == '+++\n':
-                metadata_kind = MetadataKind.Toml
-            meta_start = match.span()[1]
-        elif meta_end == 0:
-            if match.group() == '---\n':
-                if metadata_kind != MetadataKind.Yaml:
-                    raise Exception('Metadata markers mismatch -- started '
-                                    'with "---", but ended with "+++"')
-            elif match.group() == '+++\n':
-                if metadata_kind != MetadataKind.Toml:
-                    raise Exception('Metadata markers mismatch -- started '
-                                    'with "+++", but ended with "---"')
-
-            meta_end = match.span()[0]
-            content_start = match.span()[1]
-            content_end = len(text)
-            break
+    metadata_kind, metadata, content, content_line_start = \
+        _split_metadata_content(text)
 
     if metadata_kind == MetadataKind.Yaml:
-        metadata = load_yaml(text[meta_start:meta_end])
+        return load_yaml_string(metadata), content, content_line_start
     elif metadata_kind == MetadataKind.Toml:
-        metadata = toml.loads(text[meta_start:meta_end])
-    else:
-        # We didn't find any metadata here, so everything must be content
-        return {}, text, 1
+        return toml.loads(metadata), content, content_line_start
 
-    content = text[content_start:content_end]
-    # +2 for the start/end marker, which is excluded from the
-    # meta_start/meta_end
-    # +1 because we start counting at 1
-    return metadata, content, text[meta_start:meta_end].count('\n') + 3
+    return {}, content, 1
 
 
 def fixup_relative_links(document: 'DocumentNode'):
@@ -366,7 +368,7 @@ class DocumentNode(Node):
 
     def _load(self):
         if self.metadata_path:
-            self.metadata = load_yaml(self.metadata_path.read_text())
+            self.metadata = load_yaml_file(self.metadata_path)
             self._raw_content = self.src.read_text('utf-8')
             self._content_line_start = 1
         else:
@@ -399,7 +401,11 @@ class MarkdownDocumentNode(DocumentNode):
     """A node representing a Markdown document."""
     def __init__(self, configuration, **kwargs):
         super().__init__(**kwargs)
-        self.__md = self._create_markdown_processor(configuration)
+        self.__configuration = configuration
+        # Creating the processor is expensive compared to converting a typical
+        # document, so it's deferred until it's needed. Documents which are
+        # served from the cache never need one.
+        self.__md = None
 
     def _create_markdown_processor(self, configuration):
         from markdown import Markdown
@@ -426,6 +432,9 @@ class MarkdownDocumentNode(DocumentNode):
             self.content = content
             return
 
+        if self.__md is None:
+            self.__md = self._create_markdown_processor(self.__configuration)
+
         # We re-raise shortcode exceptions to adjust the line number to
         # make debugging easier
         try:
@@ -452,7 +461,7 @@ class DataNode(Node):
         self.kind = NodeKind.Data
         self.src = src
         self.path = path
-        self.content = load_yaml(self.src.open('r'))
+        self.content = load_yaml_file(self.src)
 
 
 class IndexNode(Node):
@@ -567,7 +576,7 @@ class ResourceNode(Node):
         self.path = path
         self.content = None
         if metadata_path:
-            self.metadata = load_yaml(open(metadata_path, 'r'))
+            self.metadata = load_yaml_file(metadata_path)
 
     def reload(self) -> None:
         pass
@@ -696,7 +705,7 @@ class NodeFactory(Generic[NT]):
                       suffixes: Union[str, Iterable[str]],
                       node_type: type,
                       *,
-                      extra_args: Dict[str, Any] = dict()) -> None:
+                      extra_args: Optional[Dict[str, Any]] = None) -> None:
         """Register a new node type.
 
         :param suffixes: Either one suffix, or a list of suffixes to be
@@ -711,6 +720,9 @@ class NodeFactory(Generic[NT]):
         if isinstance(suffixes, str):
             suffixes = [suffixes]
 
+        if extra_args is None:
+            extra_args = {}
+
         for suffix in suffixes:
             self.__known_types[suffix] = (node_type, extra_args,)
 
@@ -813,6 +825,63 @@ class DocumentNodeFactory(NodeFactory[DocumentNode]):
         return node
 
 
+def _read_jpeg_size(f) -> Optional[Tuple[int, int]]:
+    import struct
+    f.seek(2)
+    while True:
+        marker = f.read(4)
+        if len(marker) < 4 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        length, = struct.unpack('>H', marker[2:])
+        # All start of frame markers except DHT, JPG and DAC, which share the
+        # same range
+        if 0xC0 <= code <= 0xCF and code not in {0xC4, 0xC8, 0xCC}:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack('>HH', frame[1:])
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def _read_image_size(path: pathlib.Path) -> Optional[Tuple[int, int]]:
+    """Read the size of a PNG, JPEG or WebP image from the file header.
+
+    This avoids opening the image using PIL, which reads and parses a lot
+    more than is needed to get the image size. ``None`` is returned if the
+    format is not recognized."""
+    import struct
+    with open(path, 'rb') as f:
+        header = f.read(32)
+
+        if header.startswith(b'\x89PNG\r\n\x1a\n') and \
+                header[12:16] == b'IHDR':
+            width, height = struct.unpack('>II', header[16:24])
+            return width, height
+
+        if header.startswith(b'\xFF\xD8'):
+            return _read_jpeg_size(f)
+
+        if len(header) < 30 or header[0:4] != b'RIFF' or \
+                header[8:12] != b'WEBP':
+            return None
+
+        chunk = header[12:16]
+        if chunk == b'VP8 ':
+            width, height = struct.unpack('<HH', header[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L':
+            bits, = struct.unpack('<I', header[21:25])
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X':
+            width = int.from_bytes(header[24:27], 'little') + 1
+            height = int.from_bytes(header[27:30], 'little') + 1
+            return width, height
+
+    return None
+
+
 class StaticNode(Node):
     """A static data node.
 
@@ -825,7 +894,7 @@ class StaticNode(Node):
         self.src = src
         self.path = path
         if metadata_path:
-            self.metadata = load_yaml(open(metadata_path, 'r'))
+            self.metadata = load_yaml_file(metadata_path)
 
     def update_metadata(self) -> None:
         """Update metadata by deriving some metadata from the source file,
@@ -833,11 +902,15 @@ class StaticNode(Node):
 
         For static nodes pointing to images, this will create a new metadata
         field ``image_size`` and populate it with the image resolution."""
-        from PIL import Image
         if self.is_image:
-            image = Image.open(self.src)
+            size = _read_image_size(self.src)
+            if size is None:
+                # Fall back to PIL for anything the header parser can't handle
+                from PIL import Image
+                with Image.open(self.src) as image:
+                    size = image.size
             self.metadata.update({
-                'image_size': image.size
+                'image_size': size
             })
 
     @property
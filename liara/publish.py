@@ -11,6 +11,7 @@ from .template import Page, SiteTemplateProxy, TemplateRepository
 from .site import Site
 import pathlib
 from typing import (
+    Set,
     Union
 )
 import logging
@@ -47,7 +48,7 @@ class BuildContext:
         return self.timestamp
 
 
-def _publish_with_template(output_path: pathlib.Path,
+def _publish_with_template(publisher: 'DefaultPublisher',
                            node: Union[DocumentNode, IndexNode],
                            site: Site,
                            site_template_proxy: SiteTemplateProxy,
@@ -55,19 +56,19 @@ def _publish_with_template(output_path: pathlib.Path,
     log = logging.getLogger('liara.TemplatePublisher')
 
     page = Page(node)
-    file_path = pathlib.Path(str(output_path) + str(node.path))
-    file_path.mkdir(parents=True, exist_ok=True)
+    file_path = pathlib.Path(str(publisher._output_path) + str(node.path))
+    publisher._create_directory(file_path)
     file_path = file_path / 'index.html'
 
     template = template_repository.find_template(node.path, site)
     log.debug('Publishing %s "%s" to "%s" using template "%s"',
               node.kind.name.lower(), node.path, file_path, template.path)
-    file_path.write_text(template.render(
+    template.render_to_file(
+        file_path,
         site=site_template_proxy,
         page=page,
         node=node,
-        build_context=BuildContext(node)
-        ), encoding='utf-8')
+        build_context=BuildContext(node))
 
     return file_path
 
@@ -79,12 +80,24 @@ class DefaultPublisher(Publisher):
                  site: Site):
         self._output_path = output_path
         self._site = site
+        self.__directories: Set[pathlib.Path] = set()
 
-    def publish_resource(self, resource: ResourceNode):
+    def _create_directory(self, path: pathlib.Path) -> None:
+        """Create a directory including all parents.
+
+        Directories created through this publisher are remembered, so
+        publishing many files into the same directory only creates it once.
+        """
         import os
+        if path in self.__directories:
+            return
+        os.makedirs(path, exist_ok=True)
+        self.__directories.add(path)
+
+    def publish_resource(self, resource: ResourceNode):
         assert resource is not None
         file_path = pathlib.Path(str(self._output_path) + str(resource.path))
-        os.makedirs(file_path.parent, exist_ok=True)
+        self._create_directory(file_path.parent)
         if resource.content is None:
             self.__log.warning(
                 'Resource node "%s" has no content, skipping', resource.path)
@@ -93,13 +106,12 @@ class DefaultPublisher(Publisher):
         return file_path
 
     def publish_generated(self, generated: GeneratedNode):
-        import os
         if generated.content is None:
             self.__log.warning(
                 'Generated node "%s" has no content, skipping', generated.path)
             return
         file_path = pathlib.Path(str(self._output_path) + str(generated.path))
-        os.makedirs(file_path.parent, exist_ok=True)
+        self._create_directory(file_path.parent)
         if isinstance(generated.content, bytes):
             file_path.write_bytes(generated.content)
         else:
@@ -112,7 +124,7 @@ class DefaultPublisher(Publisher):
         from contextlib import suppress
         assert static is not None
         file_path = pathlib.Path(str(self._output_path) + str(static.path))
-        os.makedirs(file_path.parent, exist_ok=True)
+        self._create_directory(file_path.parent)
 
         with suppress(FileExistsError):
             # Symlink requires an absolute path
@@ -133,19 +145,19 @@ class TemplatePublisher(DefaultPublisher):
     def __init__(self, output_path: pathlib.Path, site: Site,
                  template_repository: TemplateRepository):
         super().__init__(output_path, site)
-        self.__site_template_proxy = SiteTemplateProxy(self._site)
+        self.__site_template_proxy = SiteTemplateProxy.for_site(self._site)
         self.__template_repository = template_repository
 
     def publish_document(self, document):
         assert document is not None
-        return _publish_with_template(self._output_path, document,
+        return _publish_with_template(self, document,
                                       self._site,
                                       self.__site_template_proxy,
                                       self.__template_repository)
 
     def publish_index(self, index: IndexNode):
         assert index is not None
-        return _publish_with_template(self._output_path, index,
+        return _publish_with_template(self, index,
                                       self._site,
                                       self.__site_template_proxy,
                                       self.__template_repository)
@@ -3,9 +3,13 @@ from .nodes import Node, NodeKind, _parse_node_kind
 from .template import Page
 from typing import Union
 
+import itertools
 import re
 
 
+_MISSING = object()
+
+
 class SelectionFilter:
     """Base class for query selection filters."""
     def match(self, node: Node) -> bool:
@@ -22,12 +26,11 @@ class MetadataFilter(SelectionFilter):
         self.__value = value
 
     def match(self, node: Node) -> bool:
-        if self.__name in node.metadata:
-            if self.__value is not None:
-                return node.metadata[self.__name] == self.__value
-            else:
-                return True
-        return False
+        if self.__value is None:
+            return self.__name in node.metadata
+        # A single lookup, using a sentinel which never compares equal to
+        # the value in case the field is missing
+        return node.metadata.get(self.__name, _MISSING) == self.__value
 
 
 class TagFilter(SelectionFilter):
@@ -200,32 +203,35 @@ class Query(Iterable[Union[Node, Page]]):
         if self.__result is not None:
             return
 
-        self.__result = []
-        result = self.__nodes
-        for f in self.__filters:
-            result = filter(lambda x: f.match(x), result)
+        result: Iterable[Node]
+        if self.__filters:
+            # Evaluate all filters in one pass, instead of chaining one
+            # filter() per selection filter
+            matchers = [f.match for f in self.__filters]
+            result = [n for n in self.__nodes
+                      if all(match(n) for match in matchers)]
+        elif self.__sorters:
+            # We sort in-place below, which must not modify the query input
+            result = list(self.__nodes)
+        else:
+            result = self.__nodes
 
-        if self.__sorters:
-            for s in self.__sorters:
-                result = sorted(result, key=s.get_key, reverse=s.reverse)
+        for s in self.__sorters:
+            result.sort(key=s.get_key, reverse=s.reverse)
 
         if self.__reversed:
             result = reversed(result)
 
+        if self.__limit > 0:
+            result = itertools.islice(result, self.__limit)
+
         def Wrap(n: Node) -> Union[Node, Page]:
             if n.kind in {NodeKind.Document, NodeKind.Index}:
                 return Page(n)
 
             return n
 
-        if self.__limit > 0:
-            for i, e in enumerate(result):
-                if i >= self.__limit:
-                    break
-                self.__result.append(Wrap(e))
-        else:
-            for e in result:
-                self.__result.append(Wrap(e))
+        self.__result = [Wrap(n) for n in result]
 
     def __iter__(self) -> Iterator[Union[Node, Page]]:
         self.__execute()
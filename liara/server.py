@@ -34,9 +34,9 @@ class HttpServer:
 
         This ensures that any change to the template configuration is
         reflected in the template repository."""
-        from .yaml import load_yaml
+        from .yaml import load_yaml_file
         template_configuration = pathlib.Path(self.__configuration['template'])
-        configuration = load_yaml(template_configuration.open())
+        configuration = load_yaml_file(template_configuration)
         self.__template_repository.update_paths(configuration['paths'])
 
     def _build_single_node(self, path: pathlib.PurePosixPath):
@@ -11,6 +11,7 @@ from .nodes import (
 )
 import pathlib
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Iterable,
@@ -24,7 +25,8 @@ from typing import (
 from .util import pairwise
 from . import signals
 import logging
-import fnmatch
+import os
+import sys
 
 
 def _create_metadata_accessor(field_name):
@@ -38,12 +40,13 @@ def _create_metadata_accessor(field_name):
     If the field is not present, this function returns ``None``.
     """
     if '.' in field_name:
+        first, *rest = field_name.split('.')
+
         def key_fun(o):
-            field = field_name.split('.')
-            o = o.metadata.get(field[0])
+            o = o.metadata.get(first)
             if o is None:
                 return None
-            for f in field[1:]:
+            for f in rest:
                 if hasattr(o, f):
                     o = getattr(o, f)
                 elif f in o:
@@ -65,26 +68,24 @@ def _create_metadata_filter(exclude_without:
     The filter function will check if the specified fields are present,
     and, if a tuple has been passed, if that field matches the expected
     value."""
-    key_functions = []
+    # Accessors and expected values are bound when the filter is created, so
+    # each check uses its own field instead of the last one in the list
+    checks = []
     for f in exclude_without:
         if isinstance(f, str):
-            key = f
-
-            def key_function(node: Node):
-                return _create_metadata_accessor(key)(node) is not None
-            key_functions.append(key_function)
+            checks.append((_create_metadata_accessor(f), False, None,))
         else:
             assert isinstance(f, tuple)
             assert len(f) == 2
-            key = f[0]
-
-            def key_function(node: Node):
-                return _create_metadata_accessor(key)(node) == f[1]
-            key_functions.append(key_function)
+            checks.append((_create_metadata_accessor(f[0]), True, f[1],))
 
     def filter_function(node: Node):
-        for key_function in key_functions:
-            if not key_function(node):
+        for accessor, compare, value in checks:
+            result = accessor(node)
+            if compare:
+                if result != value:
+                    return False
+            elif result is None:
                 return False
         return True
 
@@ -164,8 +165,9 @@ class Collection:
             else:
                 reverse = False
 
+            accessor = _create_metadata_accessor(ordering)
+
             def key_fun(node):
-                accessor = _create_metadata_accessor(ordering)
                 result = accessor(node)
                 if result is None:
                     self.__log.error(
@@ -426,6 +428,7 @@ class Site:
     """Metadata describing this site."""
 
     __nodes: Dict[pathlib.PurePosixPath, Node]
+    __nodes_by_url: Dict[str, Node]
     __root = pathlib.PurePosixPath('/')
     __collections: Dict[str, Collection]
     __indices: List[Index]
@@ -441,6 +444,7 @@ class Site:
         self.generated = []
         self.metadata = {}
         self.__nodes = {}
+        self.__nodes_by_url = {}
         self.__collections = {}
         self.__indices = []
         self.__content_filters = []
@@ -529,6 +533,9 @@ class Site:
 
         signals.content_added.send(self, node=node)
         self.__nodes[node.path] = node
+        # Interned, so all users of the URL string share one object and
+        # lookups can short-cut the comparison
+        self.__nodes_by_url[sys.intern(str(node.path))] = node
 
     @property
     def nodes(self) -> ValuesView[Node]:
@@ -540,6 +547,17 @@ class Site:
         """The list of all registered URLs."""
         return self.__nodes.keys()
 
+    @property
+    def url_strings(self) -> AbstractSet[str]:
+        """The list of all registered URLs as strings.
+
+        Checking a string against this avoids creating a path object first,
+        which is useful when checking many URLs.
+
+        .. versionadded:: 2.5.5
+        """
+        return self.__nodes_by_url.keys()
+
     def create_links(self):
         """This creates links between parents/children.
 
@@ -622,7 +640,7 @@ class Site:
         formats  -- this function iterates over all static nodes that contain
         images, and creates new thumbnail nodes as required.
         """
-        from .util import add_suffix
+        from .util import add_suffix, _compile_glob
 
         def create_thumbnail(new_path, format, size):
             if format == 'original':
@@ -653,27 +671,37 @@ class Site:
                 format)
             self.add_resource(thumbnail)
 
+        # The include/exclude filters are compiled once per size, instead of
+        # matching the glob patterns against every image
+        size_filters = {}
+        for k, v in thumbnail_definition['sizes'].items():
+            if 'exclude' in v and 'include' in v:
+                self.__log.warning('Thumbnail size "%s" has both '
+                                   '"include" and "exclude" filters '
+                                   'enabled, "include" will be ignored.', k)
+
+            if pattern := v.get('exclude'):
+                size_filters[k] = (pattern, _compile_glob(pattern), True,)
+            elif pattern := v.get('include'):
+                size_filters[k] = (pattern, _compile_glob(pattern), False,)
+
         new_static = []
         for static in self.static:
             if not static.is_image:
                 continue
             static.update_metadata()
             width, height = static.metadata['image_size']
+            src = os.path.normcase(static.src)
             for k, v in thumbnail_definition['sizes'].items():
-                if 'exclude' in v and 'include' in v:
-                    self.__log.warning('Thumbnail size "%s" has both '
-                                       '"include" and "exclude" filters '
-                                       'enabled, "include" will be ignored.')
-
-                if pattern := v.get('exclude'):
-                    if fnmatch.fnmatch(static.src, pattern):
+                if size_filter := size_filters.get(k):
+                    pattern, regex, exclude = size_filter
+                    if exclude and regex.match(src):
                         self.__log.debug(
                                 'Skipping thumbnail creation for "%s" due to '
                                 'exclude filter "%s"',
                                 static.src, pattern)
                         continue
-                elif pattern := v.get('include'):
-                    if not fnmatch.fnmatch(static.src, pattern):
+                    elif not exclude and not regex.match(src):
                         self.__log.debug(
                                 'Skipping thumbnail creation for "%s" due to '
                                 'include filter "%s"',
@@ -739,6 +767,9 @@ class Site:
             -> Optional[Node]:
         """Get a node based on the URL, or ``None`` if no such node exists."""
         if isinstance(path, str):
+            # Strings matching a URL exactly don't need to be normalized
+            if (node := self.__nodes_by_url.get(path)) is not None:
+                return node
             path = pathlib.PurePosixPath(path)
         return self.__nodes.get(path)
 
@@ -1,9 +1,19 @@
 from .cache import Cache
+from .nodes import NodeKind, _parse_node_kind
+from .util import _compile_glob
+import contextlib
+import os
 import pathlib
+import re
+import urllib.parse
+import weakref
 from typing import (
     Any,
     Dict,
+    Iterable,
+    Iterator,
     Optional,
+    Tuple,
 )
 
 from typing import TYPE_CHECKING
@@ -12,6 +22,86 @@ if TYPE_CHECKING:
     from . import Site
 
 
+def _get_first_segment(url: str) -> str:
+    """Get the first path segment of an URL. For ``/``, this is an empty
+    string."""
+    return os.path.normcase(url[1:].split('/', 1)[0])
+
+
+def _get_literal_first_segment(pattern: str) -> Optional[str]:
+    """Get the first path segment of a pattern, if it contains no wildcards.
+
+    A pattern with a literal first segment can only match URLs starting with
+    the same segment, as the first ``/`` is literal as well. If the pattern
+    is not absolute or the first segment contains wildcards, ``None`` is
+    returned."""
+    if not pattern.startswith('/'):
+        return None
+
+    segment = pattern[1:].split('/', 1)[0]
+    if any(c in segment for c in '*?['):
+        return None
+    return _get_first_segment(pattern)
+
+
+class _UrlPattern:
+    """A template path pattern, parsed and compiled once.
+
+    Patterns are globs, optionally followed by a query string restricting
+    the node kinds they apply to, for example ``/blog/*?kind=document``.
+    """
+    __slots__ = ('kinds', 'pattern', 'is_literal', 'first_segment',
+                 '__regex', '__prefix',)
+
+    def __init__(self, pattern: str):
+        self.kinds = None
+        if '?' in pattern:
+            pattern, params_str = pattern.split('?')
+            params = urllib.parse.parse_qs(params_str)
+
+            if kinds := params.get('kind'):
+                self.kinds = {_parse_node_kind(kind) for kind in kinds}
+
+        self.pattern = pattern
+        self.is_literal = not any(c in pattern for c in '*?[')
+        self.first_segment = _get_literal_first_segment(pattern)
+        self.__regex = _compile_glob(pattern)
+        # Everything up to the first wildcard must match literally, which is
+        # much cheaper to check than running the regular expression
+        self.__prefix = os.path.normcase(re.split(r'[*?\[]', pattern, 1)[0])
+
+    def match(self, url: str, normcase_url: str, site: 'Site') \
+            -> Optional[int]:
+        """Match an url against this pattern.
+
+        :param normcase_url: The url passed through ``os.path.normcase``.
+                             This is passed in, so matching an url against
+                             many patterns only needs to normalize it once.
+        :return: An integer indicating the match score, with 0 being a perfect
+                 match and higher values being increasingly bad. ``None`` is
+                 returned if no match was found.
+        """
+        if self.kinds and site:
+            node = site.get_node(url)
+            assert node
+
+            if node.kind not in self.kinds:
+                return None
+
+        # Exact matches always win
+        if self.pattern == url:
+            return 0
+        # If not exact, we'll look for the longest matching pattern,
+        # assuming it is the most specific
+        if normcase_url.startswith(self.__prefix) \
+                and self.__regex.match(normcase_url):
+            # abs is required, if our pattern is /*, and the url we match
+            # against is /, then the pattern is longer than the URL
+            return abs(len(url) - len(self.pattern))
+
+        return None
+
+
 def _match_url(url: pathlib.PurePosixPath, pattern: str, site: 'Site') \
         -> Optional[int]:
     """Match an url against a pattern.
@@ -20,36 +110,14 @@ def _match_url(url: pathlib.PurePosixPath, pattern: str, site: 'Site') \
              match and higher values being increasingly bad. ``None`` is
              returned if no match was found.
     """
-    import fnmatch
-    import urllib.parse
-    from .nodes import _parse_node_kind
-    if '?' in pattern and site:
-        pattern, params_str = pattern.split('?')
-
-        node = site.get_node(url)
-        assert node
-        params = urllib.parse.parse_qs(params_str)
-
-        if kinds := params.get('kind'):
-            kinds = {_parse_node_kind(kind) for kind in kinds}
-
-            if node.kind not in kinds:
-                return None
-
-    # Exact matches always win
-    if pattern == str(url):
-        return 0
-    # If not exact, we'll look for the longest matching pattern,
-    # assuming it is the most specific
-    if fnmatch.fnmatch(str(url), pattern):
-        # abs is required, if our pattern is /*, and the url we match against
-        # is /, then the pattern is longer than the URL
-        return abs(len(str(url)) - len(pattern))
-
-    return None
+    url_str = str(url)
+    return _UrlPattern(pattern).match(url_str, os.path.normcase(url_str),
+                                      site)
 
 
 class Template:
+    __slots__ = ('_template_path',)
+
     def __init__(self, template_path='<unknown>'):
         self._template_path = template_path
 
@@ -57,54 +125,195 @@ class Template:
     def path(self):
         return self._template_path
 
+    @property
+    def _template(self) -> Any:
+        """The template object of the template backend, if any."""
+        return None
+
     def render(self, **kwargs):
-        pass
+        raise NotImplementedError()
+
+    def render_to_file(self, path: pathlib.Path, **kwargs) -> None:
+        """Render the template and write the result to ``path`` using UTF-8.
+
+        Template backends which can produce the output incrementally override
+        this to avoid building the whole output in memory first.
+
+        .. versionadded:: 2.5.5
+        """
+        path.write_text(self.render(**kwargs), encoding='utf-8')
 
 
 class TemplateRepository:
     def __init__(self, paths: Dict[str, str]):
         self.__paths = paths
+        self.__templates: Dict[str, Template] = {}
+        self.__compile_patterns(paths)
 
     def update_paths(self, paths: Dict[str, str]):
+        # The development server updates the paths before every document it
+        # publishes, so the resolved templates are only dropped if the
+        # configuration actually changed
+        if paths != self.__paths:
+            self.__compile_patterns(paths)
         self.__paths = paths
 
+    def __compile_patterns(self, paths: Dict[str, str]):
+        # The tie breaker uses the length of the full pattern, including the
+        # query string
+        patterns = [(len(pattern), _UrlPattern(pattern), template)
+                    for pattern, template in paths.items()]
+
+        # Patterns starting with a literal segment, i.e. /blog/*, can only
+        # match URLs starting with that segment. We index them by that
+        # segment, so URLs only get checked against patterns which can
+        # possibly match. The candidate lists keep the order of the paths, as
+        # ties between patterns depend on it.
+        segments = {p.first_segment for _, p, _ in patterns
+                    if p.first_segment is not None}
+        self.__patterns_by_segment = {
+            segment: [entry for entry in patterns
+                      if entry[1].first_segment in {segment, None}]
+            for segment in segments
+        }
+        self.__unindexed_patterns = [entry for entry in patterns
+                                     if entry[1].first_segment is None]
+
+        # A literal pattern only matches the identical URL, which results in
+        # the best possible score. Those can be resolved using a dictionary,
+        # unless another pattern of the same length could also match with the
+        # best score and win the tie breaker.
+        self.__literal_patterns: Dict[str, str] = {}
+        for index, (pattern_length, url_pattern, template) \
+                in enumerate(patterns):
+            if not url_pattern.is_literal \
+                    or pattern_length != len(url_pattern.pattern):
+                continue
+
+            if any(len(other.pattern) == pattern_length
+                   and (other_length > pattern_length
+                        or (other_length == pattern_length
+                            and other_index < index))
+                   for other_index, (other_length, other, _)
+                   in enumerate(patterns)):
+                continue
+
+            self.__literal_patterns[url_pattern.pattern] = template
+
+        # Patterns restricted to some node kinds also depend on the kind of
+        # the node at the url, which becomes part of the key
+        self.__has_kind_patterns = any(p.kinds for _, p, _ in patterns)
+        self.__matches: Dict[Tuple[str, Optional[NodeKind]], str] = {}
+
     def find_template(self, url: pathlib.PurePosixPath, site: 'Site') \
             -> Template:
-        pass
+        raise NotImplementedError()
+
+    @contextlib.contextmanager
+    def disable_reloading(self) -> Iterator[None]:
+        """Stop checking templates for modifications while inside this
+        context.
+
+        Template backends check the template files for changes every time a
+        template is requested. While building a site, templates don't change,
+        so the checks can be skipped.
+
+        .. versionadded:: 2.5.5
+        """
+        yield
+
+    def preload_templates(self) -> None:
+        """Load all templates referenced by the template paths.
+
+        This is not required, as templates get loaded on first use, but it
+        allows compiling all templates once up-front. Templates which fail to
+        load are skipped here, the error is raised once they get used.
+
+        .. versionadded:: 2.5.5
+        """
+        for template in self._template_names:
+            # Templates which fail to load are reported once they're used,
+            # a template which is never used must not fail the build
+            with contextlib.suppress(Exception):
+                self._get_template(template)
+
+    @property
+    def _template_names(self) -> Iterable[str]:
+        """The unique template names used in the template paths."""
+        return dict.fromkeys(self.__paths.values()).keys()
+
+    def _load_template(self, template: str) -> Any:
+        """Load a template using the template backend."""
+        raise NotImplementedError()
+
+    def _wrap_template(self, template: Any, template_path: str) -> Template:
+        """Wrap a template loaded by :py:meth:`_load_template`."""
+        raise NotImplementedError()
+
+    def _get_template(self, template: str) -> Template:
+        """Get the wrapped template for a template name."""
+        # The backend takes care of reloading modified templates, we only
+        # create a new wrapper if that happened
+        backend_template = self._load_template(template)
+        wrapper = self.__templates.get(template)
+        if wrapper is None or wrapper._template is not backend_template:
+            wrapper = self._wrap_template(backend_template, template)
+            self.__templates[template] = wrapper
+        return wrapper
 
     def _match_template(self, url: pathlib.PurePosixPath, site: 'Site') -> str:
+        # Convert the url once, instead of once per pattern
+        url_str = str(url)
+        if (match := self.__literal_patterns.get(url_str)) is not None:
+            return match
+
+        kind = None
+        if self.__has_kind_patterns and site:
+            if node := site.get_node(url_str):
+                kind = node.kind
+        if (match := self.__matches.get((url_str, kind))) is not None:
+            return match
+
+        normcase_url = os.path.normcase(url_str)
+        candidates = self.__patterns_by_segment.get(
+            _get_first_segment(url_str), self.__unindexed_patterns)
+
         best_match = None
         best_score = None
         longest_matching_pattern_length = -1
-        for pattern, template in self.__paths.items():
-            score = _match_url(url, pattern, site)
+        for pattern_length, url_pattern, template in candidates:
+            score = url_pattern.match(url_str, normcase_url, site)
             if score is None:
                 continue
 
-            # If the pattern is a better match, we always update
-            if best_score is None or score < best_score:
+            # If the pattern is a better match, we always update. Otherwise,
+            # as a tie breaker, the longer pattern wins
+            if best_score is None or score < best_score or (
+                    score == best_score
+                    and pattern_length > longest_matching_pattern_length):
                 best_score = score
                 best_match = template
-                longest_matching_pattern_length = len(pattern)
-
-            # Tie breaker: The longer pattern wins
-            if best_score == score:
-                if len(pattern) > longest_matching_pattern_length:
-                    best_match = template
-                    longest_matching_pattern_length = len(pattern)
+                longest_matching_pattern_length = pattern_length
 
         if not best_match:
             raise Exception(f'Could not find matching template for path: '
                             f'"{url}"')
 
+        self.__matches[(url_str, kind)] = best_match
         return best_match
 
 
 class MakoTemplate(Template):
+    __slots__ = ('__template',)
+
     def __init__(self, template, template_path):
         super().__init__(template_path)
         self.__template = template
 
+    @property
+    def _template(self):
+        return self.__template
+
     def render(self, **kwargs) -> str:
         return self.__template.render(**kwargs)
 
@@ -117,18 +326,42 @@ class MakoTemplateRepository(TemplateRepository):
 
     def find_template(self, url: pathlib.PurePosixPath, site: 'Site') \
             -> Template:
-        template = self._match_template(url, site)
-        return MakoTemplate(self.__lookup.get_template(template), template)
+        return self._get_template(self._match_template(url, site))
+
+    def _load_template(self, template: str) -> Any:
+        return self.__lookup.get_template(template)
+
+    def _wrap_template(self, template: Any, template_path: str) -> Template:
+        return MakoTemplate(template, template_path)
+
+    @contextlib.contextmanager
+    def disable_reloading(self) -> Iterator[None]:
+        filesystem_checks = self.__lookup.filesystem_checks
+        self.__lookup.filesystem_checks = False
+        try:
+            yield
+        finally:
+            self.__lookup.filesystem_checks = filesystem_checks
 
 
 class Jinja2Template(Template):
+    __slots__ = ('__template',)
+
     def __init__(self, template, template_path):
         super().__init__(template_path)
         self.__template = template
 
+    @property
+    def _template(self):
+        return self.__template
+
     def render(self, **kwargs) -> str:
         return self.__template.render(**kwargs)
 
+    def render_to_file(self, path: pathlib.Path, **kwargs) -> None:
+        with path.open('w', encoding='utf-8') as f:
+            self.__template.stream(**kwargs).dump(f)
+
 
 class Jinja2TemplateRepository(TemplateRepository):
     """Jinja2 based template repository."""
@@ -195,8 +428,22 @@ class Jinja2TemplateRepository(TemplateRepository):
 
     def find_template(self, url: pathlib.PurePosixPath, site: 'Site') \
             -> Template:
-        template = self._match_template(url, site)
-        return Jinja2Template(self.__env.get_template(template), template)
+        return self._get_template(self._match_template(url, site))
+
+    def _load_template(self, template: str) -> Any:
+        return self.__env.get_template(template)
+
+    def _wrap_template(self, template: Any, template_path: str) -> Template:
+        return Jinja2Template(template, template_path)
+
+    @contextlib.contextmanager
+    def disable_reloading(self) -> Iterator[None]:
+        auto_reload = self.__env.auto_reload
+        self.__env.auto_reload = False
+        try:
+            yield
+        finally:
+            self.__env.auto_reload = auto_reload
 
 
 class Page:
@@ -207,6 +454,8 @@ class Page:
     class provides convenience accessors while hiding the underlying node from
     template code.
     """
+    __slots__ = ('__node',)
+
     def __init__(self, node):
         self.__node = node
 
@@ -258,7 +507,6 @@ class Page:
         :py:class:`~liara.query.Query` instance.
         """
 
-        from .nodes import NodeKind
         from .query import Query
         assert self.__node.kind == NodeKind.Index
 
@@ -274,22 +522,48 @@ class Page:
         return Query(self.__node.children).with_node_kinds('doc', 'idx')
 
 
+# Proxies are shared by site. A live proxy keeps its site alive, so the id of
+# the site can't be reused while the entry exists
+_site_template_proxies: 'weakref.WeakValueDictionary[int, SiteTemplateProxy]' \
+    = weakref.WeakValueDictionary()
+
+
 class SiteTemplateProxy:
     """A wrapper around :py:class:`Site` for use inside templates.
     """
+    __slots__ = ('__site', '__data', '__weakref__',)
+
     __site: 'Site'
+    __data: Optional[Dict[str, Any]]
 
     def __init__(self, site: 'Site'):
         self.__site = site
-        self.__data = {}
-        for data in self.__site.data:
-            self.__data.update(data.content)
+        # Merged on first use, as many templates never access the data
+        self.__data = None
+
+    @classmethod
+    def for_site(cls, site: 'Site') -> 'SiteTemplateProxy':
+        """Get the proxy for a site. While the returned proxy is in use, the
+        same instance is returned for that site, so the site data is only
+        merged once.
+
+        .. versionadded:: 2.5.5
+        """
+        proxy = _site_template_proxies.get(id(site))
+        if proxy is None or proxy.__site is not site:
+            proxy = cls(site)
+            _site_template_proxies[id(site)] = proxy
+        return proxy
 
     @property
     def data(self) -> Dict[str, Any]:
         """Get the union of all :py:class:`liara.nodes.DataNode`
         instances in this site.
         """
+        if self.__data is None:
+            self.__data = {}
+            for data in self.__site.data:
+                self.__data.update(data.content)
         return self.__data
 
     @property
@@ -314,7 +588,7 @@ class SiteTemplateProxy:
     def get_page_by_url(self, url) -> Optional[Page]:
         """Return a page by URL. If the page cannot be found, return
         ``None``."""
-        node = self.__site.get_node(pathlib.PurePosixPath(url))
+        node = self.__site.get_node(str(url))
 
         if node:
             return Page(node)
@@ -5,6 +5,7 @@ import tzlocal
 from typing import List, Optional
 import os
 import fnmatch
+import re
 
 
 def pairwise(iterable):
@@ -101,9 +102,26 @@ def local_now() -> datetime.datetime:
     return datetime.datetime.now(tz=__TZ)
 
 
+def _compile_glob(pattern: str) -> 're.Pattern[str]':
+    """Compile a glob pattern into a regular expression.
+
+    Matching ``os.path.normcase(name)`` against the result is equivalent to
+    ``fnmatch.fnmatch(name, pattern)``, but doesn't need to look up the
+    translated pattern again for every name."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
 class FilesystemWalker:
     def __init__(self, ignore_files: Optional[List[str]] = None):
         self.__ignore_files = ignore_files if ignore_files else []
+        # All patterns are combined into one regular expression up-front,
+        # instead of matching each pattern separately against every file
+        if self.__ignore_files:
+            self.__ignore_pattern: Optional[re.Pattern] = re.compile('|'.join(
+                fnmatch.translate(os.path.normcase(pattern))
+                for pattern in self.__ignore_files))
+        else:
+            self.__ignore_pattern = None
 
     def walk(self, path: pathlib.Path):
         """Walk a directory recursively.
@@ -113,13 +131,37 @@ class FilesystemWalker:
         * Files matching the ``ignore_files`` pattern are ignored.
         * The ``dirnames`` part of the tuple is omitted
         """
-        for dirpath, _, filenames in os.walk(path):
-            files_to_ignore = set()
-            for pattern in self.__ignore_files:
-                for filename in fnmatch.filter(filenames, pattern):
-                    files_to_ignore.add(filename)
-
-            filenames = [filename for filename in filenames
-                         if filename not in files_to_ignore]
+        # Directories are visited in the same order as os.walk would, but
+        # using os.scandir directly, which provides the file type without
+        # an extra stat call for each entry
+        stack = [os.fspath(path)]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            filenames = []
+            subdirectories = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    filenames.append(entry.name)
+                # Like os.walk, don't follow symlinks to directories
+                elif not entry.is_symlink():
+                    subdirectories.append(entry.path)
+
+            if self.__ignore_pattern:
+                match = self.__ignore_pattern.match
+                filenames = [filename for filename in filenames
+                             if not match(os.path.normcase(filename))]
 
             yield dirpath, filenames
+
+            stack.extend(reversed(subdirectories))
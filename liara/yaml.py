@@ -1,10 +1,49 @@
+from collections import OrderedDict
+import os
+import pickle
 from typing import (
     IO,
+    Any,
+    Callable,
+    Hashable,
     Optional,
     Text,
     Union
 )
 
+# Parsed documents are stored pickled, as unpickling is much faster than
+# parsing and produces a fresh copy each time, so callers can modify the
+# result without corrupting the cache
+__CACHE_SIZE = 4096
+__cache: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+
+# The loader and dumper classes are resolved once on first use, as the import
+# fallback is otherwise repeated for every document
+__loader: Optional[type] = None
+__dumper: Optional[type] = None
+
+
+def _get_loader() -> type:
+    global __loader
+    if __loader is None:
+        try:
+            from yaml import CLoader as Loader
+        except ImportError:
+            from yaml import Loader
+        __loader = Loader
+    return __loader
+
+
+def _get_dumper() -> type:
+    global __dumper
+    if __dumper is None:
+        try:
+            from yaml import CDumper as Dumper
+        except ImportError:
+            from yaml import Dumper
+        __dumper = Dumper
+    return __dumper
+
 
 def load_yaml(s: Union[bytes, IO, IO[bytes], Text, IO[Text]]):
     """Load a Yaml document.
@@ -13,11 +52,76 @@ def load_yaml(s: Union[bytes, IO, IO[bytes], Text, IO[Text]]):
     implementation and falls back to the native Python version on failure.
     """
     import yaml
+    return yaml.load(s, Loader=_get_loader())
+
+
+def _create_cache_entry(document: Any) -> Optional[bytes]:
+    """Convert a parsed document into the form stored in the cache, or return
+    ``None`` if the document cannot be cached."""
     try:
-        from yaml import CLoader as Loader
-    except ImportError:
-        from yaml import Loader
-    return yaml.load(s, Loader=Loader)
+        return pickle.dumps(document, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Yaml can create arbitrary objects, which may not be pickleable.
+        # Those are simply not cached
+        return None
+
+
+def _add_cache_entry(key: Hashable, data: bytes) -> None:
+    """Add an entry created using :py:func:`_create_cache_entry`.
+
+    This allows documents to be parsed in a different process."""
+    __cache[key] = data
+    __cache.move_to_end(key)
+
+    if len(__cache) > __CACHE_SIZE:
+        __cache.popitem(last=False)
+
+
+def _file_cache_key(path: Union[str, os.PathLike]) -> Hashable:
+    stat = os.stat(path)
+    # Paths are often relative, so the key must not depend on the working
+    # directory
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size,)
+
+
+def _load_cached(key: Hashable, load: Callable[[], Any]):
+    if (data := __cache.get(key)) is not None:
+        __cache.move_to_end(key)
+        return pickle.loads(data)
+
+    result = load()
+    if (data := _create_cache_entry(result)) is not None:
+        _add_cache_entry(key, data)
+    return result
+
+
+def _load_yaml_from_file(path: Union[str, os.PathLike]):
+    with open(path, 'rb') as f:
+        return load_yaml(f)
+
+
+def load_yaml_file(path: Union[str, os.PathLike]):
+    """Load a Yaml document from a file.
+
+    The parsed document is cached in memory using the path, modification time
+    and size of the file as the key, so loading an unchanged file again skips
+    parsing. Each call returns a new object.
+
+    .. versionadded:: 2.5.5
+    """
+    return _load_cached(_file_cache_key(path),
+                        lambda: _load_yaml_from_file(path))
+
+
+def load_yaml_string(s: str):
+    """Load a Yaml document from a string.
+
+    This works like :py:func:`load_yaml_file`, but uses the string itself as
+    the cache key.
+
+    .. versionadded:: 2.5.5
+    """
+    return _load_cached(s, lambda: load_yaml(s))
 
 
 def dump_yaml(data, stream: Optional[IO] = None):
@@ -27,9 +131,4 @@ def dump_yaml(data, stream: Optional[IO] = None):
     implementation and falls back to the native Python version on failure.
     """
     import yaml
-    try:
-        from yaml import CDumper as Dumper
-    except ImportError:
-        from yaml import Dumper
-
-    return yaml.dump(data, stream, Dumper=Dumper)
+    return yaml.dump(data, stream, Dumper=_get_dumper())
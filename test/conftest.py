@@ -0,0 +1,14 @@
+import os
+import pytest
+
+
+@pytest.fixture
+def rewrite_file():
+    """Replace the content of a file and make sure its modification time
+    changes, even on file systems with a coarse timestamp resolution."""
+    def rewrite(path, content: str):
+        path.write_text(content)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns,
+                           stat.st_mtime_ns + 10_000_000_000))
+    return rewrite
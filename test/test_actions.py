@@ -0,0 +1,46 @@
+from liara.actions import _extract_links, validate_internal_links
+from liara.nodes import DocumentNode, IndexNode
+from liara.site import Site
+import pathlib
+import pytest
+
+
+class MockDocumentNode(DocumentNode):
+    def __init__(self, content):
+        super().__init__(None, pathlib.PurePosixPath('/'))
+        self.content = content
+
+
+def test_extract_links():
+    document = MockDocumentNode(
+        '<p><a href="/a">A</a><img src="/b.png"><a href="#c">C</a></p>'
+        '<p><a>D</a><a href="https://example.com/?e=1&amp;f=2">E</a></p>')
+
+    assert list(_extract_links(document)) == [
+        '/a',
+        '/b.png',
+        'https://example.com/?e=1&f=2'
+    ]
+
+
+def test_extract_links_empty_document():
+    assert list(_extract_links(MockDocumentNode(''))) == []
+
+
+@pytest.mark.parametrize('content', ['  \n', '<!-- draft -->'])
+def test_extract_links_no_elements(content):
+    assert list(_extract_links(MockDocumentNode(content))) == []
+
+
+def test_validate_internal_links():
+    site = Site()
+    site.add_index(IndexNode(pathlib.PurePosixPath('/')))
+    site.add_index(IndexNode(pathlib.PurePosixPath('/a')))
+
+    links = {
+        '/a': ['/'],
+        '/a/': ['/'],
+        '/missing': ['/', '/a'],
+    }
+
+    assert validate_internal_links(links, site) == 2
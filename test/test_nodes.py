@@ -1,4 +1,5 @@
-from liara.nodes import extract_metadata_content
+from liara.nodes import extract_metadata_content, StaticNode
+import pathlib
 import pytest
 
 
@@ -69,3 +70,41 @@ a: "b"
     assert metadata['a'] == 'b'
     assert content == ''
     assert first_content_line == 4
+
+
+def test_extract_metadata_marker_later_in_content():
+    document = """---
+a: "b"
+---
+
+content
+---
+more content
+"""
+
+    metadata, content, first_content_line = extract_metadata_content(document)
+    assert metadata == {'a': 'b'}
+    assert content == """
+content
+---
+more content
+"""
+    assert first_content_line == 4
+
+
+@pytest.mark.parametrize('suffix,format,options', [
+    ('.png', 'PNG', {}),
+    ('.jpg', 'JPEG', {}),
+    ('.jpg', 'JPEG', {'progressive': True}),
+    ('.webp', 'WEBP', {}),
+    ('.webp', 'WEBP', {'lossless': True}),
+])
+def test_static_node_image_size(tmp_path, suffix, format, options):
+    from PIL import Image
+    src = tmp_path / f'image{suffix}'
+    Image.new('RGB', (123, 45)).save(src, format, **options)
+
+    node = StaticNode(src, pathlib.PurePosixPath(f'/image{suffix}'))
+    node.update_metadata()
+
+    assert node.metadata['image_size'] == (123, 45,)
@@ -90,3 +90,37 @@ def test_query_limit():
         root.add_child(MockDocumentNode(f'/{i}', {'title': f'Page {i}'}))
 
     assert len(list(root.select_children().limit(10))) == 10
+
+
+def test_query_multiple_filters():
+    n1 = MockDocumentNode('/a', {'tags': {'a'}, 'title': 'A'})
+    n2 = MockDocumentNode('/b', {'tags': {'b'}, 'title': 'B'})
+    n3 = MockDocumentNode('/c', {'tags': {'a'}})
+
+    root = Node()
+    root.path = pathlib.PurePosixPath('/')
+    root.add_child(n1)
+    root.add_child(n2)
+    root.add_child(n3)
+
+    result = list(root.select_children().with_tag('a').with_metadata('title'))
+    assert len(result) == 1
+    assert result[0].url == '/a'
+
+
+def test_query_filter_by_metadata_value():
+    n1 = MockDocumentNode('/a', {'status': 'draft'})
+    n2 = MockDocumentNode('/b', {'status': None})
+    n3 = MockDocumentNode('/c', {})
+
+    root = Node()
+    root.path = pathlib.PurePosixPath('/')
+    root.add_child(n1)
+    root.add_child(n2)
+    root.add_child(n3)
+
+    assert len(list(root.select_children().with_metadata('status'))) == 2
+
+    drafts = list(root.select_children().with_metadata('status', 'draft'))
+    assert len(drafts) == 1
+    assert drafts[0].url == '/a'
@@ -82,6 +82,18 @@ def test_content_filters():
     assert pathlib.PurePosixPath('/public') in s.urls
 
 
+def test_get_node():
+    s = site.Site()
+    node = MockIndexNode('/a/b')
+    s.add_index(node)
+
+    assert s.get_node('/a/b') is node
+    assert s.get_node('/a/b/') is node
+    assert s.get_node(pathlib.PurePosixPath('/a/b')) is node
+    assert s.get_node('/a') is None
+    assert '/a/b' in s.url_strings
+
+
 class MockObject:
     def __init__(self, metadata):
         self.metadata = metadata
@@ -214,3 +226,34 @@ def test_index_exclude_without_key_matching_removes_items():
 
     index_node = root.get_node('/index')
     assert len(index_node.references) == 2
+
+
+def test_metadata_filter_checks_all_fields():
+    f = site._create_metadata_filter(['title', ('status', 'public')])
+
+    assert f(MockDocumentNode('/a', {'title': 'A', 'status': 'public'}))
+    assert not f(MockDocumentNode('/b', {'status': 'public'}))
+    assert not f(MockDocumentNode('/c', {'title': 'C', 'status': 'private'}))
+
+
+def test_thumbnail_filters(tmp_path):
+    from PIL import Image
+
+    s = site.Site()
+    for name in ['a.png', 'b.png']:
+        src = tmp_path / name
+        Image.new('RGB', (40, 20)).save(src)
+        s.add_static(nodes.StaticNode(src, pathlib.PurePosixPath('/' + name)))
+
+    s.create_thumbnails({
+        'sizes': {
+            'small': {'width': 20, 'include': '*a.png'},
+            'tiny': {'width': 10, 'exclude': '*a.png'},
+        },
+        'formats': ['original'],
+    })
+
+    assert {str(r.path) for r in s.resources} == {
+        '/a.small.png',
+        '/b.tiny.png',
+    }
@@ -1,7 +1,14 @@
 import pathlib
-from liara.template import _match_url, TemplateRepository
+from liara.nodes import IndexNode, StaticNode
+from liara.template import (
+    _match_url,
+    Jinja2TemplateRepository,
+    SiteTemplateProxy,
+    TemplateRepository,
+)
 import pytest
 import liara.site
+import liara.template
 
 
 @pytest.fixture
@@ -95,3 +102,132 @@ def test_match_url_same_length(default_site):
 
     t10 = tr1._match_template(pathlib.PurePosixPath('/en'), default_site)
     assert t10 == 'a'
+
+
+def test_match_template_update_paths(default_site):
+    tr = TemplateRepository({'/*': 'a'})
+    assert tr._match_template(pathlib.PurePosixPath('/en'), default_site) \
+        == 'a'
+
+    tr.update_paths({'/*': 'a', '/en': 'b'})
+    assert tr._match_template(pathlib.PurePosixPath('/en'), default_site) \
+        == 'b'
+
+
+def test_match_template_node_kind(monkeypatch):
+    tr = TemplateRepository({'/*': 'default', '/*?kind=index': 'index'})
+    url = pathlib.PurePosixPath('/a')
+
+    index_site = liara.site.Site()
+    index_site.add_index(IndexNode(url))
+    static_site = liara.site.Site()
+    static_site.add_static(StaticNode(None, url))
+
+    # The matching template depends on the node in the site, so it must not be
+    # reused for another site
+    assert tr._match_template(url, index_site) == 'index'
+    assert tr._match_template(url, static_site) == 'default'
+
+    # Once resolved, the result is reused for nodes of the same kind
+    def fail(*args):
+        assert False, 'Template match should have been cached'
+    monkeypatch.setattr(liara.template._UrlPattern, 'match', fail)
+    assert tr._match_template(url, index_site) == 'index'
+    assert tr._match_template(url, static_site) == 'default'
+
+
+def test_match_template_literal_first_segment(default_site):
+    tr = TemplateRepository(
+        {
+            '/*': 'default',
+            '/blog/*': 'blog',
+            '/about': 'about',
+            '/b*': 'b',
+        }
+    )
+
+    def match(url):
+        return tr._match_template(pathlib.PurePosixPath(url), default_site)
+
+    assert match('/') == 'default'
+    assert match('/blog/post') == 'blog'
+    assert match('/blog') == 'b'
+    assert match('/about') == 'about'
+    assert match('/other') == 'default'
+
+
+def test_jinja2_find_template_reuses_template(tmp_path, default_site,
+                                              rewrite_file):
+    template_path = tmp_path / 'page.jinja2'
+    template_path.write_text('a')
+
+    tr = Jinja2TemplateRepository({'/*': 'page.jinja2'}, tmp_path)
+    url = pathlib.PurePosixPath('/a')
+    t0 = tr.find_template(url, default_site)
+    assert tr.find_template(url, default_site) is t0
+
+    # Modified templates must still be picked up
+    rewrite_file(template_path, 'b')
+
+    t1 = tr.find_template(url, default_site)
+    assert t1 is not t0
+    assert t1.render() == 'b'
+
+
+def test_jinja2_disable_reloading(tmp_path, default_site, rewrite_file):
+    template_path = tmp_path / 'page.jinja2'
+    template_path.write_text('a')
+
+    tr = Jinja2TemplateRepository({'/*': 'page.jinja2'}, tmp_path)
+    url = pathlib.PurePosixPath('/a')
+
+    with tr.disable_reloading():
+        assert tr.find_template(url, default_site).render() == 'a'
+
+        rewrite_file(template_path, 'b')
+
+        assert tr.find_template(url, default_site).render() == 'a'
+
+    assert tr.find_template(url, default_site).render() == 'b'
+
+
+def test_jinja2_preload_templates(tmp_path, default_site):
+    (tmp_path / 'page.jinja2').write_text('a')
+    tr = Jinja2TemplateRepository({'/*': 'page.jinja2',
+                                   '/missing': 'missing.jinja2'}, tmp_path)
+
+    # Missing templates only fail once they're used
+    tr.preload_templates()
+    assert tr.find_template(pathlib.PurePosixPath('/a'), default_site) \
+        .render() == 'a'
+
+
+def test_site_template_proxy_data():
+    class MockDataNode:
+        def __init__(self, content):
+            self.content = content
+
+    class MockSite:
+        data = [MockDataNode({'a': 1, 'b': 1}), MockDataNode({'b': 2})]
+
+    proxy = SiteTemplateProxy(MockSite())
+    assert proxy.data == {'a': 1, 'b': 2}
+    assert proxy.data is proxy.data
+
+
+def test_site_template_proxy_for_site(default_site):
+    proxy = SiteTemplateProxy.for_site(default_site)
+    assert SiteTemplateProxy.for_site(default_site) is proxy
+    assert SiteTemplateProxy.for_site(object()) is not proxy
+
+
+def test_match_template_literal(default_site):
+    tr = TemplateRepository({'/*': 'default', '/about': 'about'})
+    assert tr._match_template(pathlib.PurePosixPath('/about'),
+                              default_site) == 'about'
+
+    # A pattern of the same length which comes first wins the tie breaker,
+    # even against a literal pattern
+    tr = TemplateRepository({'/**': 'glob', '/ab': 'literal'})
+    assert tr._match_template(pathlib.PurePosixPath('/ab'),
+                              default_site) == 'glob'
@@ -1,4 +1,10 @@
-from liara.util import add_suffix, flatten_dictionary, pairwise
+from liara.util import (
+    add_suffix,
+    flatten_dictionary,
+    pairwise,
+    FilesystemWalker,
+)
+import os
 
 
 def test_flatten_dictionary():
@@ -39,3 +45,21 @@ def test_pairwise_one_element_list():
 
 def test_pairwise_empty_list():
     assert list(pairwise([])) == []
+
+
+def test_filesystem_walker(tmp_path):
+    (tmp_path / 'a' / 'b').mkdir(parents=True)
+    (tmp_path / 'c').mkdir()
+    for name in ['x.md', 'x.md~', '.hidden', 'a/y.md', 'a/b/z.bak']:
+        (tmp_path / name).touch()
+
+    walker = FilesystemWalker(['*~', '.*', '*.bak'])
+    result = [(dirpath, sorted(filenames))
+              for dirpath, filenames in walker.walk(tmp_path)]
+
+    assert sorted(result) == sorted([
+        (str(tmp_path), ['x.md']),
+        (os.path.join(tmp_path, 'a'), ['y.md']),
+        (os.path.join(tmp_path, 'a', 'b'), []),
+        (os.path.join(tmp_path, 'c'), []),
+    ])
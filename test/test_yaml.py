@@ -0,0 +1,73 @@
+from liara import _find_yaml_sources, _parse_yaml_task
+from liara.yaml import load_yaml_file, load_yaml_string
+import liara.yaml
+import os
+
+
+def test_load_yaml_file_returns_copies(tmp_path):
+    p = tmp_path / 'data.yaml'
+    p.write_text('a:\n  - 1\n  - 2\n')
+
+    d0 = load_yaml_file(p)
+    d0['a'].append(3)
+
+    d1 = load_yaml_file(p)
+    assert d1 == {'a': [1, 2]}
+
+
+def test_load_yaml_file_detects_changes(tmp_path, rewrite_file):
+    p = tmp_path / 'data.yaml'
+    p.write_text('a: 1\n')
+    assert load_yaml_file(p) == {'a': 1}
+
+    rewrite_file(p, 'a: 23\n')
+    assert load_yaml_file(p) == {'a': 23}
+
+
+def test_load_yaml_file_relative_paths(tmp_path, monkeypatch):
+    for name, value in [('a', 1), ('b', 2)]:
+        (tmp_path / name).mkdir()
+        p = tmp_path / name / 'data.yaml'
+        p.write_text(f'v: {value}\n')
+        # Same size and modification time, as with files extracted from an
+        # archive
+        os.utime(p, ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / 'a')
+    assert load_yaml_file('data.yaml') == {'v': 1}
+    monkeypatch.chdir(tmp_path / 'b')
+    assert load_yaml_file('data.yaml') == {'v': 2}
+
+
+def test_load_yaml_string_returns_copies():
+    d0 = load_yaml_string('a: {b: 1}')
+    d0['a']['b'] = 2
+
+    assert load_yaml_string('a: {b: 1}') == {'a': {'b': 1}}
+
+
+def test_parsed_yaml_task_populates_cache(tmp_path, monkeypatch):
+    (tmp_path / 'a.md').write_text('---\ntitle: A\n---\ncontent\n')
+    (tmp_path / 'b.md').write_text('content')
+    (tmp_path / 'b.meta').write_text('title: B\n')
+    (tmp_path / 'c.yaml').write_text('c: 1\n')
+    (tmp_path / 'README').write_text('static')
+    (tmp_path / 'README.meta').write_text('title: README\n')
+
+    sources = _find_yaml_sources(str(tmp_path),
+                                 ['a.md', 'b.md', 'b.meta', 'c.yaml',
+                                  'README', 'README.meta'],
+                                 {'.md'})
+    assert len(sources) == 4
+
+    for key, data in _parse_yaml_task(sources):
+        liara.yaml._add_cache_entry(key, data)
+
+    def fail(s):
+        assert False, 'Yaml document should have been cached'
+    monkeypatch.setattr(liara.yaml, 'load_yaml', fail)
+
+    assert load_yaml_string('title: A\n') == {'title': 'A'}
+    assert load_yaml_file(tmp_path / 'b.meta') == {'title': 'B'}
+    assert load_yaml_file(tmp_path / 'c.yaml') == {'c': 1}
+    assert load_yaml_file(tmp_path / 'README.meta') == {'title': 'README'}